@@ -1037,7 +1037,8 @@ class Grid:
 
         def min_dist(pts):
             c = self.cell_centers
-            d = np.sum(np.power(c - pts, 2), axis=0)
+            diff = c - pts
+            d = np.sum(diff * diff, axis=0)
             min_id = np.argmin(d)
             return min_id, np.sqrt(d[min_id])
 
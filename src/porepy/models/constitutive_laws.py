@@ -2191,7 +2191,7 @@ class ThermalExpansion(PorePyModel):
 
         val = (2 * mu + 3 * lmbda) * alpha
 
-        return pp.SecondOrderTensor(val * np.ones(size))
+        return pp.SecondOrderTensor(np.full(size, val, dtype=float))
 
 
 class ThermalConductivityLTE(PorePyModel):
@@ -3471,8 +3471,8 @@ class ElasticModuli(PorePyModel):
             Cell-wise stiffness tensor in SI units.
 
         """
-        lmbda = self.solid.lame_lambda() * np.ones(subdomain.num_cells)
-        mu = self.solid.shear_modulus() * np.ones(subdomain.num_cells)
+        lmbda = np.full(subdomain.num_cells, self.solid.lame_lambda(), dtype=float)
+        mu = np.full(subdomain.num_cells, self.solid.shear_modulus(), dtype=float)
         return pp.FourthOrderTensor(mu, lmbda)
 
     def characteristic_contact_traction(
@@ -3919,7 +3919,7 @@ class BiotCoefficient(PorePyModel):
         """
         size = sum(sd.num_cells for sd in subdomains)
         value = self.solid.biot_coefficient()
-        return pp.SecondOrderTensor(value * np.ones(size))
+        return pp.SecondOrderTensor(np.full(size, value, dtype=float))
 
 
 class SpecificStorage(PorePyModel):
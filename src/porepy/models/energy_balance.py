@@ -707,7 +707,7 @@ class BoundaryConditionsEnergyBalance(pp.BoundaryConditionMixin):
             values on the provided boundary grid.
 
         """
-        return self.fluid.temperature() * np.ones(boundary_grid.num_cells)
+        return np.full(boundary_grid.num_cells, self.fluid.temperature(), dtype=float)
 
     def bc_values_fourier_flux(self, boundary_grid: pp.BoundaryGrid) -> np.ndarray:
         """**Heat** flux values on the Neumann boundary to be used with Fourier's law.
@@ -451,7 +451,7 @@ class ModelGeometry(PorePyModel):
                 ].project_tangential_normal(sd.num_cells)
                 for sd in subdomains
             ]
-            local_coord_proj = sps.block_diag(local_coord_proj_list)
+            local_coord_proj = sps.block_diag(local_coord_proj_list, format="csr")
         else:
             # Also treat no subdomains
             local_coord_proj = sps.csr_matrix((0, 0))
@@ -619,7 +619,7 @@ class ModelGeometry(PorePyModel):
                 matrices.append(switcher_int)
 
             # Construct the block diagonal matrix.
-            sign_flipper = pp.ad.SparseArray(sps.block_diag(matrices).tocsr())
+            sign_flipper = pp.ad.SparseArray(sps.block_diag(matrices, format="csr"))
         sign_flipper.set_name("Flip_normal_vectors")
         return sign_flipper
 
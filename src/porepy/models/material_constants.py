@@ -37,6 +37,8 @@ class MaterialConstants:
 
         """Units of the material."""
         self._constants = constants
+        self._unit_scales: dict[str, float] = {}
+        """Cache of scaling factors computed by :meth:`unit_scale`."""
 
     @property
     def units(self) -> pp.Units:
@@ -57,6 +59,8 @@ class MaterialConstants:
         """
         # TODO: Should we use a @property setter here?
         self._units = units
+        # Scaling factors computed with the previous units are no longer valid.
+        self._unit_scales = {}
 
     @property
     def constants(self) -> dict:
@@ -109,30 +113,55 @@ class MaterialConstants:
             Value in the user specified units to be used in the simulation.
 
         """
-        # Make a copy of the value to avoid modifying the original.
-        # This is not strictly necessary for scalars, but is done in case the method is
-        # used for arrays.
-        if isinstance(value, np.ndarray):
-            value = value.copy()
-        # Trim any spaces
-        units = units.replace(" ", "")
-        if units in ["", "1", "-"]:
+        scale = self.unit_scale(units)
+        if scale == 1:
+            # Return a copy to avoid modifying the original array. This is not
+            # strictly necessary for scalars.
+            if isinstance(value, np.ndarray):
+                return value.copy()
             return value
-        # Traverse string specifying units, and convert to SI units
-        # The string is traversed by first splitting at *.
-        # If the substring contains a ^, the substring is split again, and the first
-        # element is raised to the power of the second.
-        for sub_unit in units.split("*"):
-            if "^" in sub_unit:
-                sub_unit, power = sub_unit.split("^")
-                factor = getattr(self._units, sub_unit) ** float(power)
-            else:
-                factor = getattr(self._units, sub_unit)
-            if to_si:
-                value *= factor
-            else:
-                value /= factor
-        return value
+        # The arithmetic operation creates a new array, thus the original is not
+        # modified.
+        if to_si:
+            return value * scale
+        else:
+            return value / scale
+
+    def unit_scale(self, units: str) -> float:
+        """Scaling factor from user specified units to SI units.
+
+        Conversion to SI units amounts to multiplying a value by the factor, while
+        conversion to the user specified units amounts to division, see
+        :meth:`convert_units`. The factors are cached for each units string, so that
+        repeated conversions of the same quantity do not parse the string anew.
+
+        Parameters:
+            units: Units of the value, see :meth:`convert_units`.
+
+        Returns:
+            Scaling factor.
+
+        """
+        if units in self._unit_scales:
+            return self._unit_scales[units]
+
+        # Trim any spaces
+        trimmed_units = units.replace(" ", "")
+        scale = 1.0
+        if trimmed_units not in ["", "1", "-"]:
+            # Traverse string specifying units, and convert to SI units
+            # The string is traversed by first splitting at *.
+            # If the substring contains a ^, the substring is split again, and the
+            # first element is raised to the power of the second.
+            for sub_unit in trimmed_units.split("*"):
+                if "^" in sub_unit:
+                    sub_unit, power = sub_unit.split("^")
+                    factor = getattr(self._units, sub_unit) ** float(power)
+                else:
+                    factor = getattr(self._units, sub_unit)
+                scale *= factor
+        self._unit_scales[units] = scale
+        return scale
 
     def verify_constants(self, user_constants, default_constants):
         """Verify that the user has specified valid constants.
@@ -564,11 +564,16 @@ class SolutionStrategy(abc.ABC, PorePyModel):
         """
         A, b = self.linear_system
         t_0 = time.time()
-        logger.debug(f"Max element in A {np.max(np.abs(A)):.2e}")
-        logger.debug(
-            f"""Max {np.max(np.sum(np.abs(A), axis=1)):.2e} and min
-            {np.min(np.sum(np.abs(A), axis=1)):.2e} A sum."""
-        )
+        # The matrix statistics require passes over all nonzeros of A, only compute
+        # them if they are actually logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            abs_A = abs(A)
+            row_sums = abs_A.sum(axis=1)
+            logger.debug(f"Max element in A {abs_A.max():.2e}")
+            logger.debug(
+                f"""Max {np.max(row_sums):.2e} and min
+                {np.min(row_sums):.2e} A sum."""
+            )
 
         solver = self.linear_solver
         if solver == "pypardiso":
@@ -271,7 +271,11 @@ def discretize_from_list(
 ) -> None:
     """For a list of (ideally uniquified) discretizations, perform the actual
     discretization.
+
+    Cached matrices of merged operators are invalidated, see
+    :meth:`MergedOperator.invalidate_cache`.
     """
+    MergedOperator.invalidate_cache()
     for discr in discretizations:
         # discr is a discretization (on node or interface in the MixedDimensionalGrid sense)
 
@@ -546,8 +550,27 @@ class MergedOperator(operators.Operator):
     Objects of this class should not be access directly, but rather through the
     Discretization class.
 
+    The merged matrix is cached between calls to :meth:`parse`, and reused as long as
+    the local discretization matrices are the same objects and no discretization has
+    been performed since the last parsing, see :meth:`invalidate_cache`.
+
     """
 
+    _discretization_state: int = 0
+    """Counter identifying the state of all discretization matrices. Increased by
+    :meth:`invalidate_cache` whenever discretization matrices may have changed."""
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Invalidate the cached merged matrices of all merged operators.
+
+        This is called by :func:`discretize_from_list`. If discretization matrices are
+        updated by other means, notably by in-place modifications, this method must be
+        called before the merged operators are parsed again.
+
+        """
+        cls._discretization_state += 1
+
     def _key(self) -> str:
         return (
             f"(merged_op, discretization_matrix_key={self._discretization_matrix_key},"
@@ -583,6 +606,12 @@ class MergedOperator(operators.Operator):
         self._inner_physics_key = inner_physics_key
         self.domain = domains
 
+        self._cached_state: Optional[tuple[int, list]] = None
+        """Discretization state and local matrices used to compute the cached merged
+        matrix."""
+        self._cached_mat: Optional[sps.spmatrix] = None
+        """Merged matrix computed in the last call to :meth:`parse`."""
+
     def __repr__(self) -> str:
         if len(self.interfaces) == 0:
             s = f"Operator with key {self._discretization_matrix_key} defined on "
@@ -645,6 +674,20 @@ class MergedOperator(operators.Operator):
             # TODO: EK is almost sure this never happens, but leave this check for now.
             raise NotImplementedError("")
 
+        # Reuse the merged matrix from the previous call if the local matrices are
+        # unchanged. The local matrices are compared by identity; keeping references to
+        # them in the cache ensures their ids are not recycled.
+        if (
+            self._cached_state is not None
+            and self._cached_state[0] == MergedOperator._discretization_state
+            and len(self._cached_state[1]) == len(mat)
+            and all(a is b for a, b in zip(self._cached_state[1], mat))
+        ):
+            return self._cached_mat
+
         else:
             # This is a standard discretization; wrap it in a diagonal sparse matrix.
-            return sps.block_diag(mat, format="csr")
+            merged_mat = sps.block_diag(mat, format="csr")
+            self._cached_state = (MergedOperator._discretization_state, mat)
+            self._cached_mat = merged_mat
+            return merged_mat
@@ -592,7 +592,7 @@ class EquationSystem:
 
         """
         variables = self._parse_variable_type(variables)
-        var_ids = [var.id for var in variables]
+        var_ids = set(var.id for var in variables)
         # Storage for atomic blocks of the sub vector (identified by name-grid pairs).
         values = []
 
@@ -665,7 +665,7 @@ class EquationSystem:
         dof_start = 0
         dof_end = 0
         variables = self._parse_variable_type(variables)
-        var_ids = [var.id for var in variables]
+        var_ids = set(var.id for var in variables)
 
         for id_, variable_number in self._variable_numbers.items():
             if id_ in var_ids:
@@ -1016,6 +1016,32 @@ class EquationSystem:
 
         return all_indices
 
+    def dof_slice_of(self, variable: Variable) -> slice:
+        """Get the range of indices in the global vector of unknowns belonging to a
+        variable.
+
+        The dofs of a variable form a contiguous block in the global vector. In
+        contrast to :meth:`dofs_of`, no array of indices is created.
+
+        Parameters:
+            variable: Variable for which the range of indices is requested.
+
+        Returns:
+            A slice representing the indices corresponding to ``variable``.
+
+        Raises:
+            ValueError: If an unknown variable is passed as argument.
+
+        """
+        if variable.id not in self._variable_numbers:
+            raise ValueError(
+                f"Variable {variable.name} with ID {variable.id} not registered among"
+                + f" DOFS of equation system {self}."
+            )
+        variable_number = self._variable_numbers[variable.id]
+        start = int(np.sum(self._variable_num_dofs[:variable_number]))
+        return slice(start, start + int(self._variable_num_dofs[variable_number]))
+
     def identify_dof(self, dof: int) -> Variable:
         """Identifies the variable to which a specific DOF index belongs.
 
@@ -486,7 +486,7 @@ class MortarProjections:
             )
         else:
             self.sign_of_mortar_sides = SparseArray(
-                sps.block_diag(mats), name="SignOfMortarSides"
+                sps.block_diag(mats, format="csr"), name="SignOfMortarSides"
             )
 
     def __repr__(self) -> str:
@@ -699,7 +699,7 @@ class Divergence(Operator):
                 sps.kron(pp.fvutils.scalar_divergence(sd), sps.eye(self.dim))
                 for sd in self.subdomains
             ]
-        matrix = sps.block_diag(mat)
+        matrix = sps.block_diag(mat, format="csr")
         return matrix
 
 
@@ -126,6 +126,11 @@ class Operator:
 
     """
 
+    # Operators are created in large numbers when equations are composed, hence the
+    # attributes are stored in slots rather than in an instance dictionary. Subclasses
+    # without their own __slots__ declaration still have an instance dictionary.
+    __slots__ = ("_domains", "_domain_type", "func", "children", "operation", "_name")
+
     class Operations(Enum):
         """Object representing all supported operations by the operator class.
 
@@ -242,6 +247,27 @@ class Operator:
         """The name given to this variable."""
         return self._name
 
+    def __getstate__(self) -> tuple[Optional[dict], dict[str, Any]]:
+        """State of the operator, used by copy, deepcopy and pickle.
+
+        Slots which are shadowed by an attribute of a subclass are left out. This
+        concerns :attr:`func`, which some subclasses implement as a method. Including
+        it would store the method bound to this operator in the copy, which would then
+        evaluate the original operator.
+
+        Returns:
+            The instance dictionary (None for operators without one) and the values of
+            the slots.
+
+        """
+        cls = type(self)
+        slots: dict[str, Any] = {}
+        for base in cls.__mro__:
+            for name in base.__dict__.get("__slots__", ()):
+                if getattr(cls, name) is base.__dict__[name] and hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        return getattr(self, "__dict__", None), slots
+
     def _initialize_children(
         self,
         operation: Optional[Operator.Operations] = None,
@@ -335,7 +361,12 @@ class Operator:
         eqs: pp.ad.EquationSystem,
         ad_base: AdArray | np.ndarray,
     ):
-        """Recursive parsing of operator tree to return numerical representation.
+        """Parsing of operator tree to return numerical representation.
+
+        The tree is traversed in post-order using an explicit stack rather than
+        recursion: Leaves are parsed by :meth:`_parse_leaf`, and the operation of an
+        inner node is applied by :meth:`_apply_operation` as soon as all its children
+        are parsed.
 
         TODO: Currently, there is no prioritization between the operations; for
         some reason, things just work. We may need to make an ordering in which the
@@ -344,7 +375,7 @@ class Operator:
         this is not the case.
 
         Parameters:
-            op: The operator to be parsed (for recursion in tree of ``self``).
+            op: The operator to be parsed.
             eqs: Equation system and its grid on which to perform the parsing.
             ad_base: Starting point for forward mode, containing values
                 (and possibly derivatives as identities) of the global vector at current
@@ -353,6 +384,48 @@ class Operator:
         Returns:
             The numerical representation of this operator.
 
+        """
+        # Stack of nodes to be processed, together with a flag indicating whether the
+        # children of the node have already been parsed.
+        stack: list[tuple[Any, bool]] = [(op, False)]
+        # Numerical representations of the parsed nodes whose parent operation is yet
+        # to be applied.
+        values: list[Any] = []
+
+        while stack:
+            node, children_parsed = stack.pop()
+            if children_parsed:
+                # The results of the children are the last entries of the values.
+                num_children = len(node.children)
+                results = values[-num_children:]
+                del values[-num_children:]
+                values.append(self._apply_operation(node, results))
+            elif isinstance(node, Operator) and not node.is_leaf():
+                # Revisit the node after its children. These are pushed in reverse
+                # order to be parsed in their original order.
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+            else:
+                values.append(self._parse_leaf(node, eqs, ad_base))
+
+        return values[0]
+
+    def _parse_leaf(
+        self,
+        op: Operator,
+        eqs: pp.ad.EquationSystem,
+        ad_base: AdArray | np.ndarray,
+    ):
+        """Parse a leaf of the operator tree to its numerical representation.
+
+        Parameters:
+            op: The leaf to be parsed.
+            eqs: Equation system and its grid on which to perform the parsing.
+            ad_base: Starting point for forward mode, see :meth:`_parse_operator`.
+
+        Returns:
+            The numerical representation of the leaf.
+
         """
 
         # The parsing strategy depends on the operator at hand:
@@ -361,8 +434,8 @@ class Operator:
         #    a) A md-variable with dofs per atomic variable.
         #    b) An atomic variable with its dofs.
         #    c) Some wrapper for discretizations or other data.
-        # 3) If it is an operator with children, invoke recursion and
-        #    proceed to the non-void operation.
+        # Operators with children are treated by _parse_operator and
+        # _apply_operation.
 
         # Case 1), Some numeric data, or already evaluated operator.
         if isinstance(op, AdArray | np.ndarray | pp.number):
@@ -375,44 +448,51 @@ class Operator:
 
         # Case 2) Leaf operators or variables
         # NOTE Should MD variables really be leaves?
-        if op.is_leaf():
-            # Case 2.a) Md-variable
-            if isinstance(op, MixedDimensionalVariable):
-                if op.is_previous_iterate or op.is_previous_time:
-                    # Empty vector like the global vector of unknowns for prev time/iter
-                    # insert the values at the right dofs and slice
-                    vals = np.empty_like(
-                        ad_base.val if isinstance(ad_base, AdArray) else ad_base
-                    )
-                    # list of indices for sub variables
-                    dofs = []
-                    for sub_var in op.sub_vars:
-                        sub_dofs = eqs.dofs_of([sub_var])
-                        vals[sub_dofs] = sub_var.parse(eqs.mdg)
-                        dofs.append(sub_dofs)
-
-                    return vals[np.hstack(dofs, dtype=int)] if dofs else np.array([])
-                # Like for atomic variables, ad_base contains current time and iter
-                else:
-                    return ad_base[eqs.dofs_of([op])]
-            # Case 2.b) atomic variables
-            elif isinstance(op, Variable):
-                # If a variable represents a previous iteration or time, parse values.
-                if op.is_previous_iterate or op.is_previous_time:
-                    return op.parse(eqs.mdg)
-                # Otherwise use the current time and iteration values.
-                else:
-                    return ad_base[eqs.dofs_of([op])]
-            # Case 2.c) All other leafs like discretizations or some wrapped data
+        assert op.is_leaf(), "Failure in parsing: Operator is not a leaf."
+        # Case 2.a) Md-variable
+        if isinstance(op, MixedDimensionalVariable):
+            if op.is_previous_iterate or op.is_previous_time:
+                # Empty vector like the global vector of unknowns for prev time/iter
+                # insert the values at the right dofs and slice
+                vals = np.empty_like(
+                    ad_base.val if isinstance(ad_base, AdArray) else ad_base
+                )
+                # list of indices for sub variables
+                dofs = []
+                for sub_var in op.sub_vars:
+                    sub_dofs = eqs.dofs_of([sub_var])
+                    vals[sub_dofs] = sub_var.parse(eqs.mdg)
+                    dofs.append(sub_dofs)
+
+                return vals[np.hstack(dofs, dtype=int)] if dofs else np.array([])
+            # Like for atomic variables, ad_base contains current time and iter
+            else:
+                return ad_base[eqs.dofs_of([op])]
+        # Case 2.b) atomic variables
+        elif isinstance(op, Variable):
+            # If a variable represents a previous iteration or time, parse values.
+            if op.is_previous_iterate or op.is_previous_time:
+                return op.parse(eqs.mdg)
+            # Otherwise use the current time and iteration values.
             else:
-                # Mypy complains because the return type of parse is Any.
-                return op.parse(eqs.mdg)  # type:ignore
+                return ad_base[eqs.dofs_of([op])]
+        # Case 2.c) All other leafs like discretizations or some wrapped data
+        else:
+            # Mypy complains because the return type of parse is Any.
+            return op.parse(eqs.mdg)  # type:ignore
 
-        # Case 3) This is a non-atomic operator with an assigned operation
-        # Invoke recursion
-        results = [self._parse_operator(child, eqs, ad_base) for child in op.children]
+    def _apply_operation(self, op: Operator, results: list):
+        """Apply the operation of an operator to the parsed values of its children.
+
+        Parameters:
+            op: Operator with children.
+            results: Numerical representations of the children of ``op``, in the same
+                order as the children.
 
-        # Finally, do the operation
+        Returns:
+            The numerical representation of ``op``.
+
+        """
         operation = op.operation
         if operation == Operator.Operations.add:
             # To add we need two objects
@@ -1158,6 +1238,12 @@ class Operator:
         return " ".join(tmp)
 
     def _parse_other(self, other):
+        # Fast path: Look up the wrapper for the most common numerical types by their
+        # exact type. Subclasses of these types are handled by the checks below.
+        wrapper = _OPERAND_WRAPPERS.get(type(other))
+        if wrapper is not None:
+            return [self, wrapper(other)]
+
         if isinstance(other, float) or isinstance(other, int):
             return [self, Scalar(other)]
         elif isinstance(other, np.ndarray):
@@ -1412,6 +1498,8 @@ class SparseArray(Operator):
 
     """
 
+    __slots__ = ("_mat", "_shape", "_hash_value")
+
     def __init__(self, mat: sps.spmatrix, name: Optional[str] = None) -> None:
         super().__init__(name=name)
         self._mat = mat
@@ -1531,6 +1619,8 @@ class DenseArray(Operator):
 
     """
 
+    __slots__ = ("_values", "_hash_value")
+
     def __init__(self, values: np.ndarray, name: Optional[str] = None) -> None:
         """Construct an Ad representation of a numpy array.
 
@@ -1701,6 +1791,8 @@ class Scalar(Operator):
 
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: float, name: Optional[str] = None) -> None:
         super().__init__(name=name)
         # Force the data to be float, so that we limit the number of combinations of
@@ -1752,6 +1844,18 @@ class Scalar(Operator):
         self._value = value
 
 
+_OPERAND_WRAPPERS: dict[type, Callable[[Any], Operator]] = {
+    float: Scalar,
+    int: Scalar,
+    np.float64: Scalar,
+    np.ndarray: DenseArray,
+    sps.csr_matrix: SparseArray,
+    sps.csc_matrix: SparseArray,
+}
+"""Ad wrappers for numerical operands of arithmetic operations, by exact type. Used by
+:meth:`Operator._parse_other`."""
+
+
 class Variable(TimeDependentOperator, IterativeOperator):
     """AD operator representing a variable defined on a single grid or mortar grid.
 
@@ -2182,7 +2286,7 @@ def _ad_wrapper(
     """
     if type(vals) is not np.ndarray:
         assert size is not None, "Size must be set if vals is not an array"
-        value_array: np.ndarray = vals * np.ones(size)
+        value_array: np.ndarray = np.full(size, vals, dtype=float)
     else:
         value_array = vals
 
@@ -313,7 +313,9 @@ class Biot(pp.Mpsa):
 
         for key, alpha_input in scalar_vector_mappings.items():
             if isinstance(alpha_input, (float, int)):
-                alphas[key] = pp.SecondOrderTensor(alpha_input * np.ones(sd.num_cells))
+                alphas[key] = pp.SecondOrderTensor(
+                    np.full(sd.num_cells, alpha_input, dtype=float)
+                )
             else:
                 alphas[key] = alpha_input
 
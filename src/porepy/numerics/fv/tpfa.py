@@ -182,7 +182,7 @@ class Tpfa(pp.FVElliptic):
         else:
             nk *= fc_cc
             t_face = nk.sum(axis=0)
-            dist_face_cell = np.power(fc_cc, 2).sum(axis=0)
+            dist_face_cell = (fc_cc * fc_cc).sum(axis=0)
 
         t_face = np.divide(t_face, dist_face_cell)
 
@@ -612,7 +612,7 @@ class DifferentiableTpfa:
         for g in subdomains:
             fi, ci, _ = sps.find(g.cell_faces)
             fc_cc = g.face_centers[:, fi] - g.cell_centers[:, ci]
-            vals.append(np.power(fc_cc, 2).sum(axis=0))
+            vals.append((fc_cc * fc_cc).sum(axis=0))
         return np.hstack(vals)
 
     def half_face_geometry_matrices(
@@ -167,25 +167,46 @@ class BoundaryCondition(AbstractBoundaryCondition):
                     "You are now specifying conditions on internal \
                               boundaries. Be very careful!"
                 )
-            if isinstance(cond, str):
-                cond = [cond] * faces.size
-            if faces.size != len(cond):
-                raise ValueError("One BC per face")
-
-            for ind in np.arange(faces.size):
-                s = cond[ind]
-                if s.lower() == "neu":
-                    pass  # Neumann is already default
-                elif s.lower() == "dir":
-                    self.is_dir[faces[ind]] = True
-                    self.is_neu[faces[ind]] = False
-                    self.is_rob[faces[ind]] = False
-                elif s.lower() == "rob":
-                    self.is_dir[faces[ind]] = False
-                    self.is_neu[faces[ind]] = False
-                    self.is_rob[faces[ind]] = True
-                else:
+            # Empty face arrays may be given with a non-integer dtype.
+            faces = faces.ravel().astype(int)
+            if faces.size == 0:
+                # No conditions to assign, the conditions are not validated.
+                pass
+            elif isinstance(cond, str):
+                # A uniform condition is validated once and assigned to all faces.
+                cond_type = cond.lower()
+                if cond_type not in ["dir", "neu", "rob"]:
                     raise ValueError("Boundary should be Dirichlet, Neumann or Robin")
+                # Neumann is already default, only Dirichlet and Robin faces need to
+                # be set.
+                if cond_type != "neu":
+                    self.is_dir[faces] = cond_type == "dir"
+                    self.is_rob[faces] = cond_type == "rob"
+                    self.is_neu[faces] = False
+            else:
+                if faces.size != len(cond):
+                    raise ValueError("One BC per face")
+
+                cond_types = np.char.lower(np.asarray(cond, dtype=str))
+                is_dir = cond_types == "dir"
+                is_rob = cond_types == "rob"
+                if not np.all(is_dir | is_rob | (cond_types == "neu")):
+                    raise ValueError("Boundary should be Dirichlet, Neumann or Robin")
+
+                # Neumann is already default, only Dirichlet and Robin faces need to be
+                # set. If a face is given more than once, the last Dirichlet or Robin
+                # condition applies. The order of assignment for repeated indices is not
+                # specified for numpy arrays, thus the last occurrence of each face is
+                # found explicitly, by searching the reversed array of faces.
+                is_set = is_dir | is_rob
+                set_faces = faces[is_set]
+                unique_faces, ind_reversed = np.unique(
+                    set_faces[::-1], return_index=True
+                )
+                last = set_faces.size - 1 - ind_reversed
+                self.is_dir[unique_faces] = is_dir[is_set][last]
+                self.is_rob[unique_faces] = is_rob[is_set][last]
+                self.is_neu[unique_faces] = False
 
     def __repr__(self) -> str:
         num_cond = self.is_neu.sum() + self.is_dir.sum() + self.is_rob.sum()
@@ -28,17 +28,15 @@ class DataSavingMixin(PorePyModel):
     """
 
     def save_data_time_step(self) -> None:
-        # Fetching the desired times to export
-        times_to_export = self.params.get("times_to_export", None)
+        # Fetching the desired times to export, sorted in initialize_data_saving.
+        times_to_export = self._times_to_export
         if times_to_export is None:
             # Export all time steps if times are not specified.
             do_export = True
         else:
             # If times are specified, export should only occur if the current time is in
             # the list of times to export.
-            do_export = bool(
-                np.any(np.isclose(self.time_manager.time, times_to_export))
-            )
+            do_export = self._is_time_in_sorted_times(times_to_export)
 
         if do_export:
             self.write_pvd_and_vtu()
@@ -46,6 +44,27 @@ class DataSavingMixin(PorePyModel):
         # Save solver statistics to file
         self.nonlinear_solver_statistics.save()
 
+    def _is_time_in_sorted_times(self, times: np.ndarray) -> bool:
+        """Check whether the current time is close to one of a set of sorted times.
+
+        Since the times are sorted, only the two times neighbouring the current time
+        need to be compared to it, using np.isclose.
+
+        Note:
+            A pointer to the next time, advanced as the simulation proceeds, is not
+            used, since the time may be reduced after a nonlinear failure.
+
+        Parameters:
+            times: Sorted array of times.
+
+        Returns:
+            True if the current time is close to one of the times.
+
+        """
+        t = self.time_manager.time
+        ind = int(np.searchsorted(times, t))
+        return bool(np.any(np.isclose(t, times[max(ind - 1, 0) : ind + 1])))
+
     def write_pvd_and_vtu(self) -> None:
         """Helper function for writing the .vtu and .pvd files and time information."""
         self.exporter.write_vtu(self.data_to_export(), time_dependent=True)
@@ -56,7 +75,9 @@ class DataSavingMixin(PorePyModel):
             self.exporter.write_pvd(append=True, from_pvd_file=pvd_file)
         else:
             self.exporter.write_pvd()
-        self.time_manager.write_time_information(params["folder_name"] / "times.json")
+        self.time_manager.write_time_information(
+            Path(self.params["folder_name"]) / "times.json"
+        )
 
     def data_to_export(self) -> list[DataInput]:
         """Return data to be exported.
@@ -69,12 +90,14 @@ class DataSavingMixin(PorePyModel):
         """
         data = []
         variables = self.equation_system.variables
+        # Fetch the values of all variables at once. The dofs of each variable form a
+        # contiguous block of the global vector, thus the values of the individual
+        # variables are views rather than copies. Scaling to SI units creates the
+        # exported arrays.
+        all_scaled_values = self.equation_system.get_variable_values(time_step_index=0)
         for var in variables:
-            scaled_values = self.equation_system.get_variable_values(
-                variables=[var], time_step_index=0
-            )
-            units = var.tags["si_units"]
-            values = self.fluid.convert_units(scaled_values, units, to_si=True)
+            scaled_values = all_scaled_values[self.equation_system.dof_slice_of(var)]
+            values = scaled_values * self.fluid.unit_scale(var.tags["si_units"])
             data.append((var.domain, var.name, values))
 
         # Add secondary variables/derived quantities.
@@ -87,21 +110,26 @@ class DataSavingMixin(PorePyModel):
         #           (grid, "name", self._evaluate_and_scale(sd, "name", "units"))
         #       )
         #       return data
-        for dim in range(self.nd + 1):
-            for sd in self.mdg.subdomains(dim=dim):
-                if dim < self.nd:
-                    data.append(
-                        (sd, "aperture", self._evaluate_and_scale(sd, "aperture", "m"))
-                    )
-                data.append(
-                    (
-                        sd,
-                        "specific_volume",
-                        self._evaluate_and_scale(
-                            sd, "specific_volume", f"m^{self.nd - sd.dim}"
-                        ),
-                    )
-                )
+        # The quantities are evaluated jointly for all subdomains, with units
+        # depending on the dimension of the subdomain for the specific volume.
+        subdomains = self.mdg.subdomains()
+        fractures_and_intersections = [sd for sd in subdomains if sd.dim < self.nd]
+        apertures = self._evaluate_and_scale_subdomains(
+            fractures_and_intersections, "aperture", "m"
+        )
+        data.extend(
+            (sd, "aperture", vals)
+            for sd, vals in zip(fractures_and_intersections, apertures)
+        )
+        specific_volumes = self._evaluate_and_scale_subdomains(
+            subdomains,
+            "specific_volume",
+            [f"m^{self.nd - sd.dim}" for sd in subdomains],
+        )
+        data.extend(
+            (sd, "specific_volume", vals)
+            for sd, vals in zip(subdomains, specific_volumes)
+        )
 
         # We combine grids and mortar grids. This is supported by the exporter, but not
         # by the type hints in the exporter module. Hence, we ignore the type hints.
@@ -119,15 +147,52 @@ class DataSavingMixin(PorePyModel):
             grid: Grid or mortar grid for which the method should be evaluated.
             method_name: Name of the method to be evaluated.
             units: Units of the quantity returned by the method. Should be parsable by
-                :meth:`porepy.fluid.FluidConstants.convert_units`.
+                :meth:`porepy.fluid.FluidConstants.unit_scale`.
 
         Returns:
             Array of values for the quantity, scaled to SI units.
 
         """
         vals_scaled = getattr(self, method_name)([grid]).value(self.equation_system)
-        vals = self.fluid.convert_units(vals_scaled, units, to_si=True)
-        return vals
+        # The evaluated array may be stored elsewhere (e.g. the values of a wrapped
+        # array), hence the scaling is not done in place.
+        return vals_scaled * self.fluid.unit_scale(units)
+
+    def _evaluate_and_scale_subdomains(
+        self,
+        subdomains: list[pp.Grid],
+        method_name: str,
+        units: Union[str, list[str]],
+    ) -> list[np.ndarray]:
+        """Evaluate a cell-wise derived quantity jointly on a list of subdomains and
+        scale the result to SI units.
+
+        The method is evaluated once for all subdomains, and the result is split into
+        the values of the individual subdomains.
+
+        Parameters:
+            subdomains: List of subdomains for which the method should be evaluated.
+            method_name: Name of the method to be evaluated.
+            units: Units of the quantity returned by the method, either common to all
+                subdomains or given for each subdomain. Should be parsable by
+                :meth:`porepy.fluid.FluidConstants.unit_scale`.
+
+        Returns:
+            List of arrays of values for the quantity, scaled to SI units, one for each
+            subdomain.
+
+        """
+        if len(subdomains) == 0:
+            return []
+        vals_scaled = getattr(self, method_name)(subdomains).value(self.equation_system)
+        num_cells = [sd.num_cells for sd in subdomains]
+        if isinstance(units, str):
+            scale: Union[float, np.ndarray] = self.fluid.unit_scale(units)
+        else:
+            # Expand the scaling factors of the subdomains to cell-wise values.
+            scale = np.repeat([self.fluid.unit_scale(u) for u in units], num_cells)
+        vals = vals_scaled * scale
+        return np.split(vals, np.cumsum(num_cells)[:-1])
 
     def initialize_data_saving(self) -> None:
         self.exporter = pp.Exporter(
@@ -140,6 +205,13 @@ class DataSavingMixin(PorePyModel):
             length_scale=self.units.m,
         )
 
+        # Sort the times to export once, to allow for fast lookup of the current time
+        # in save_data_time_step.
+        times_to_export = self.params.get("times_to_export", None)
+        self._times_to_export: Optional[np.ndarray] = (
+            None if times_to_export is None else np.sort(np.asarray(times_to_export))
+        )
+
         if "solver_statistics_file_name" in self.params:
             self.nonlinear_solver_statistics.path = (
                 Path(self.params["folder_name"])
@@ -204,9 +276,9 @@ class VerificationDataSaving(DataSavingMixin):
                 collected_data = self.collect_data()
                 self.results.append(collected_data)
         else:  # time-dependent problem
-            t = self.time_manager.time  # current time
-            scheduled = self.time_manager.schedule[1:]  # scheduled times except t_init
-            if any(np.isclose(t, scheduled)):
+            # Scheduled times except t_init. The schedule is strictly increasing.
+            scheduled = self.time_manager.schedule[1:]
+            if self._is_time_in_sorted_times(scheduled):
                 collected_data = self.collect_data()
                 self.results.append(collected_data)
 
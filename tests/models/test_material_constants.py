@@ -177,3 +177,25 @@ def test_convert_units(modify_dict, base_units):
     dimensionless_units = ["", "1", "-", "   "]
     for unit in dimensionless_units:
         assert np.isclose(material.convert_units(1, unit), 1)
+
+
+def test_convert_units_array():
+    """Test conversion of arrays and the caching of scaling factors.
+
+    The conversion should not modify the input array, and the cached scaling factors
+    should be updated when new units are set.
+    """
+    material = pp.MaterialConstants({})
+    material.set_units(pp.Units(m=2, kg=3))
+
+    values = np.arange(3, dtype=float)
+    converted = material.convert_units(values, "m^2*kg", to_si=True)
+    assert np.allclose(converted, 12 * values)
+    assert np.allclose(material.convert_units(converted, "m^2*kg"), values)
+    # The input should not be modified, also for dimensionless units.
+    assert np.allclose(values, np.arange(3))
+    assert material.convert_units(values, "-") is not values
+
+    # Setting new units should invalidate the cached scaling factors.
+    material.set_units(pp.Units(m=5))
+    assert np.isclose(material.unit_scale("m^2*kg"), 25)
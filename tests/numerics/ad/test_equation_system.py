@@ -113,7 +113,7 @@ def test_variable_creation():
     The test generates a MixedDimensionalGrid, defines some variables on it, and checks
     that the variables have the correct sizes and names.
 
-    Also tested is the methods num_dofs() and partly dofs_of()
+    Also tested is the methods num_dofs(), dof_slice_of() and partly dofs_of()
     """
 
     mdg, _ = square_with_orthogonal_fractures("cartesian", {"cell_size": 0.5}, [1])
@@ -195,6 +195,13 @@ def test_variable_creation():
     )
     assert sys_man.dofs_of(interface_variable.sub_vars).size == ndof_interface
 
+    # The dofs of each variable form a contiguous block, given by dof_slice_of.
+    for var in sys_man.variables:
+        dof_slice = sys_man.dof_slice_of(var)
+        assert np.array_equal(
+            np.arange(sys_man.num_dofs())[dof_slice], sys_man.dofs_of([var])
+        )
+
     assert (
         sys_man.num_dofs() == ndof_subdomains + ndof_single_subdomain + ndof_interface
     )
@@ -24,6 +24,7 @@ Checks performed include the following:
 """
 
 import copy
+import sys
 from typing import Literal, Union
 
 import numpy as np
@@ -146,6 +147,29 @@ def test_copy_operator_tree():
     assert not np.allclose(c.value(eq_system), c_deepcopy.value(eq_system))
 
 
+def test_copy_operator_func():
+    """Test that copies of operators keep their functional representation.
+
+    For operators implementing func as a method, the copy should evaluate itself rather
+    than the original operator.
+
+    """
+
+    class FuncOperator(pp.ad.Operator):
+        def func(self):
+            return self
+
+    op = FuncOperator()
+    for op_copy in [copy.copy(op), copy.deepcopy(op)]:
+        assert op_copy.func() is op_copy
+
+    # A functional representation assigned to an operator is shared by the copies.
+    op = pp.ad.Operator()
+    op.func = np.sum
+    assert copy.copy(op).func is np.sum
+    assert copy.deepcopy(op).func is np.sum
+
+
 ## Test of pp.ad.SparseArray, pp.ad.DenseArray, pp.ad.Scalar
 fields = [
     (pp.ad.SparseArray, sps.csr_matrix(np.random.rand(3, 2))),
@@ -252,6 +276,20 @@ def test_ad_operator_unary_minus_parsing():
     assert np.allclose(op._parse_operator(-op, eqsys, None).data, -(mat1 + mat2).data)
 
 
+def test_parse_deep_operator_tree():
+    """Check that operator trees deeper than the recursion limit can be parsed, and
+    that the children of an operator are parsed in their original order."""
+    array = pp.ad.DenseArray(np.array([1.0, 2.0]))
+    op = array
+    depth = 2 * sys.getrecursionlimit()
+    for _ in range(depth):
+        op = op + array
+    # Subtraction does not commute, thus the order of the operands is tested.
+    op = op - array * 2.0
+    eqsys = pp.ad.EquationSystem(pp.MixedDimensionalGrid())
+    assert np.allclose(op._parse_operator(op, eqsys, None), (depth - 1) * array._values)
+
+
 def test_time_dependent_array():
     """Test of time-dependent arrays (wrappers around numpy arrays)."""
 
@@ -1395,6 +1433,48 @@ def test_ad_discretization_class():
     assert np.allclose(known_sub_val, sub_discr_ad.foobar().parse(mdg).diagonal())
 
 
+def test_merged_operator_cache():
+    """Test that the parsed matrix of a merged operator is reused until the local
+    discretization matrices are replaced or the cache is invalidated."""
+    mdg, _ = pp.mdg_library.square_with_orthogonal_fractures(
+        "cartesian", {"cell_size": 0.5}, fracture_indices=[1]
+    )
+    subdomains = mdg.subdomains()
+
+    key = "foo"
+    discr = _MockDiscretization(key)
+    discr_ad = pp.ad.Discretization()
+    discr_ad.subdomains = subdomains
+    discr_ad._discretization = discr
+    pp.ad._ad_utils.wrap_discretization(discr_ad, discr, subdomains)
+
+    for sd in subdomains:
+        data = mdg.subdomain_data(sd)
+        data[pp.DISCRETIZATION_MATRICES] = {
+            key: {"foobar": sps.identity(sd.num_cells, format="csr")}
+        }
+
+    op = discr_ad.foobar()
+    mat = op.parse(mdg)
+    # Parsing without changes to the discretization returns the cached matrix.
+    assert op.parse(mdg) is mat
+
+    # Replacing a local matrix triggers a new assembly.
+    sd = subdomains[0]
+    mdg.subdomain_data(sd)[pp.DISCRETIZATION_MATRICES][key]["foobar"] = (
+        2 * sps.identity(sd.num_cells, format="csr")
+    )
+    new_mat = op.parse(mdg)
+    assert new_mat is not mat
+    assert np.allclose(new_mat.diagonal()[: sd.num_cells], 2)
+
+    # In-place modifications are only picked up after explicit invalidation.
+    mdg.subdomain_data(sd)[pp.DISCRETIZATION_MATRICES][key]["foobar"].data[:] = 3
+    assert op.parse(mdg) is new_mat
+    pp.ad._ad_utils.MergedOperator.invalidate_cache()
+    assert np.allclose(op.parse(mdg).diagonal()[: sd.num_cells], 3)
+
+
 ## Below are helpers for tests of the Ad wrappers.
 def _compare_matrices(m1, m2):
     if isinstance(m1, pp.ad.SparseArray):
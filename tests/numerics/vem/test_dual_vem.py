@@ -1147,50 +1147,50 @@ class TestMVEMRHS:
 
 
 class TestVEMConvergence:
+    """The analytical functions below are evaluated on arrays of coordinates, e.g.
+    ``x, y, z = sd.cell_centers``, so that all cells are treated at once."""
+
     def _rhs(self, x, y, z, case):
+        xx, yy = x * x, y * y
         if case == 1:
+            two_pi_x, two_pi_y = 2.0 * np.pi * x, 2.0 * np.pi * y
+            sin_x, sin_y = np.sin(two_pi_x), np.sin(two_pi_y)
             return (
-                8.0
-                * np.pi**2
-                * np.sin(2.0 * np.pi * x)
-                * np.sin(2.0 * np.pi * y)
-                * (1 + 100.0 * x**2 + 100.0 * y**2)
-                - 400.0 * np.pi * y * np.cos(2.0 * np.pi * y) * np.sin(2.0 * np.pi * x)
-                - 400.0 * np.pi * x * np.cos(2.0 * np.pi * x) * np.sin(2.0 * np.pi * y)
+                8.0 * np.pi**2 * sin_x * sin_y * (1 + 100.0 * xx + 100.0 * yy)
+                - 200.0 * two_pi_y * np.cos(two_pi_y) * sin_x
+                - 200.0 * two_pi_x * np.cos(two_pi_x) * sin_y
             )
         elif case == 2:
+            pi_y = np.pi * y
+            sin_y, pi_y_cos_y = np.sin(pi_y), pi_y * np.cos(pi_y)
+            r = xx + yy + 1.0
             return (
-                7.0 * z * (x**2 + y**2 + 1.0)
-                - y * (x**2 - 9.0 * z**2)
-                - 4.0 * x**2 * z
-                - (
-                    8.0 * np.sin(np.pi * y)
-                    - 4.0 * np.pi**2 * y**2 * np.sin(np.pi * y)
-                    + 16.0 * np.pi * y * np.cos(np.pi * y)
-                )
-                * (x**2 / 2.0 + y**2 / 2.0 + 1.0 / 2.0)
-                - 4.0
-                * y**2
-                * (2.0 * np.sin(np.pi * y) + np.pi * y * np.cos(np.pi * y))
+                7.0 * z * r
+                - y * (xx - 9.0 * z * z)
+                - 4.0 * xx * z
+                - (8.0 * sin_y - 4.0 * pi_y * pi_y * sin_y + 16.0 * pi_y_cos_y)
+                * r
+                / 2.0
+                - 4.0 * yy * (2.0 * sin_y + pi_y_cos_y)
             )
         else:
-            return 8.0 * z * (125.0 * x**2 + 200.0 * y**2 + 425.0 * z**2 + 2.0)
+            return 8.0 * z * (125.0 * xx + 200.0 * yy + 425.0 * z * z + 2.0)
 
     def _solution(self, x, y, z, case):
         if case == 1:
             return np.sin(2.0 * np.pi * x) * np.sin(2.0 * np.pi * y)
         elif case == 2:
-            return x**2 * z + 4.0 * y**2 * np.sin(np.pi * y) - 3.0 * z**3
+            return x * x * z + 4.0 * y * y * np.sin(np.pi * y) - 3.0 * z * z * z
         else:
-            return x**2 * z + 4.0 * y**2 * np.sin(np.pi * y) - 3.0 * z**3
+            return x * x * z + 4.0 * y * y * np.sin(np.pi * y) - 3.0 * z * z * z
 
     def _permeability(self, x, y, z, case):
         if case == 1:
-            return 1 + 100.0 * x**2 + 100.0 * y**2
+            return 1 + 100.0 * (x * x + y * y)
         elif case == 2:
-            return 1.0 + x**2 + y**2
+            return 1.0 + x * x + y * y
         else:
-            return 1.0 + 100.0 * (x**2 + y**2 + z**2.0)
+            return 1.0 + 100.0 * (x * x + y * y + z * z)
 
     def _expected_order(self, case):
         if case == 1:
@@ -1207,41 +1207,43 @@ class TestVEMConvergence:
             sd.compute_geometry()
         elif case == 2:
             sd = pp.StructuredTriangleGrid([Nx, Ny], [1, 1])
-            R = pp.map_geometry.rotation_matrix(np.pi / 4.0, [1, 0, 0])
-            sd.nodes = np.dot(R, sd.nodes)
+            self._rotate_around_x_axis(sd, np.pi / 4.0)
             sd.compute_geometry()
         else:
             sd = pp.StructuredTriangleGrid([Nx, Ny], [1, 1])
-            R = pp.map_geometry.rotation_matrix(np.pi / 2.0, [1, 0, 0])
-            sd.nodes = np.dot(R, sd.nodes)
+            self._rotate_around_x_axis(sd, np.pi / 2.0)
             sd.compute_geometry()
         return sd
 
+    def _rotate_around_x_axis(self, sd, angle):
+        """Rotate the grid nodes as by pp.map_geometry.rotation_matrix(angle, [1, 0, 0]).
+
+        Only the y and z coordinates are affected, and they are updated in place.
+        """
+        cos_a, sin_a = np.cos(angle), np.sin(angle)
+        y, z = sd.nodes[1], sd.nodes[2]
+        sd.nodes[1:] = cos_a * y - sin_a * z, sin_a * y + cos_a * z
+
     def _assign_parameters(self, sd, case):
         """
         Define the permeability, apertures, boundary conditions
         """
         # Permeability
-        kxx = np.array([self._permeability(*pt, case) for pt in sd.cell_centers.T])
+        x, y, z = sd.cell_centers
+        kxx = self._permeability(x, y, z, case)
         perm = pp.SecondOrderTensor(kxx)
 
         # Source term
-        source = sd.cell_volumes * np.array(
-            [self._rhs(*pt, case) for pt in sd.cell_centers.T]
-        )
+        source = sd.cell_volumes * self._rhs(x, y, z, case)
 
         # Boundaries
         bound_faces = sd.tags["domain_boundary_faces"].nonzero()[0]
         bound_face_centers = sd.face_centers[:, bound_faces]
 
-        labels = np.array(["dir"] * bound_faces.size)
-
         bc_val = np.zeros(sd.num_faces)
-        bc_val[bound_faces] = np.array(
-            [self._solution(*pt, case) for pt in bound_face_centers.T]
-        )
+        bc_val[bound_faces] = self._solution(*bound_face_centers, case)
 
-        bound = pp.BoundaryCondition(sd, bound_faces, labels)
+        bound = pp.BoundaryCondition(sd, bound_faces, "dir")
         specified_parameters = {
             "second_order_tensor": perm,
             "source": source,
@@ -1251,8 +1253,8 @@ class TestVEMConvergence:
         return pp.initialize_default_data(sd, {}, "flow", specified_parameters)
 
     def _error_p(self, sd, p, case):
-        sol = np.array([self._solution(*pt, case) for pt in sd.cell_centers.T])
-        return np.sqrt(np.sum(np.power(np.abs(p - sol), 2) * sd.cell_volumes))
+        diff = p - self._solution(*sd.cell_centers, case)
+        return np.sqrt(np.sum(diff * diff * sd.cell_volumes))
 
     def _compute_approximation(self, N, case):
         sd = self._create_grid(N, case)
@@ -1,13 +1,47 @@
 """Tests for boundary conditions.
 
-Currently only tests the bases for 2d and 3d Vectorial BCs.
+Currently tests the assignment of scalar BC types, and the bases for 2d and 3d
+Vectorial BCs.
 
 """
 import numpy as np
+import pytest
 
 import porepy as pp
 
 
+def test_scalar_condition_types():
+    g = pp.CartGrid([2, 1])
+    # The boundary faces are 0, 2, 3, 4, 5, 6. Face 3 is given twice, in which case the
+    # last condition applies, and a Neumann condition does not override a previous one.
+    faces = np.array([0, 2, 3, 3, 4, 4])
+    bc = pp.BoundaryCondition(g, faces, ["dir", "NEU", "dir", "rob", "Rob", "neu"])
+
+    assert np.array_equal(np.where(bc.is_dir)[0], [0])
+    assert np.array_equal(np.where(bc.is_rob)[0], [3, 4])
+    assert np.array_equal(np.where(bc.is_neu)[0], [2, 5, 6])
+
+    # Uniform conditions can be given as a string, faces as a boolean array.
+    is_face = np.zeros(g.num_faces, dtype=bool)
+    is_face[[0, 2]] = True
+    bc = pp.BoundaryCondition(g, is_face, "dir")
+    assert np.array_equal(np.where(bc.is_dir)[0], [0, 2])
+    assert np.array_equal(np.where(bc.is_neu)[0], [3, 4, 5, 6])
+
+    # Empty face arrays, possibly of float type, are accepted for any condition. No
+    # conditions are then assigned.
+    for cond in [[], np.empty(0), "dir", ""]:
+        bc = pp.BoundaryCondition(g, np.empty(0), cond)
+        assert np.all(bc.is_neu[bc.bf])
+        assert not np.any(bc.is_dir) and not np.any(bc.is_rob)
+
+    # Invalid condition types should raise an error, also when given as a string.
+    with pytest.raises(ValueError):
+        pp.BoundaryCondition(g, faces, ["dir", "neu", "dir", "rob", "rob", "foo"])
+    with pytest.raises(ValueError):
+        pp.BoundaryCondition(g, is_face, "foo")
+
+
 def test_default_basis_2d():
     g = pp.StructuredTriangleGrid([1, 1])
     bc = pp.BoundaryConditionVectorial(g)
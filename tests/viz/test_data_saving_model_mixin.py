@@ -2,13 +2,17 @@
 
 The following is covered:
 * Test that only the specified exported times are exported.
+* Test that verification data is saved only at the scheduled times.
+* Test the evaluation of derived quantities for export.
 
 """
 
 import numpy as np
 
 import porepy as pp
+from porepy.models.fluid_mass_balance import SinglePhaseFlow
 from porepy.models.momentum_balance import MomentumBalance
+from porepy.viz.data_saving_model_mixin import VerificationDataSaving
 from porepy.applications.md_grids.model_geometries import (
     SquareDomainOrthogonalFractures,
 )
@@ -68,3 +72,98 @@ def test_export_chosen_times(times_to_export):
         assert np.allclose(model.exported_times, times_to_export)
     else:
         assert np.allclose(model.exported_times, np.sort(times_to_export))
+
+
+@pytest.mark.parametrize("times_to_export", [[], [0.6, 0.2, 0.4]])
+def test_export_close_to_chosen_times(times_to_export):
+    """Test that export occurs only at times close to the times to export.
+
+    The times to export are either empty or unsorted. The current time is set to
+    values slightly above and below the times to export, both within and outside
+    the tolerance of the comparison.
+
+    """
+    model = DataSavingModelMixinSetup(
+        {
+            "time_manager": pp.TimeManager(schedule=[0.0, 1.0], dt_init=0.1),
+            "times_to_export": times_to_export,
+        }
+    )
+    model.exported_times = []
+    model.prepare_simulation()
+
+    close_times = [0.2, 0.2 + 1e-12, 0.2 - 1e-12, 0.4, 0.6 + 1e-12, 0.6 - 1e-12]
+    other_times = [0.0, 0.2 + 1e-3, 0.2 - 1e-3, 0.5, 0.6 + 1e-3, 1.0]
+    for t in close_times + other_times:
+        model.time_manager.time = t
+        model.save_data_time_step()
+
+    expected = close_times if len(times_to_export) > 0 else []
+    assert np.allclose(model.exported_times, expected)
+
+
+class VerificationDataSavingSetup(VerificationDataSaving, DataSavingModelMixinSetup):
+    """Model setup collecting the times at which verification data is saved."""
+
+    def collect_data(self) -> float:
+        return self.time_manager.time
+
+
+def test_verification_data_saving_at_scheduled_times():
+    """Test that verification data is collected only at the scheduled times.
+
+    The initial time of the schedule is excluded.
+
+    """
+    model = VerificationDataSavingSetup(
+        {"time_manager": pp.TimeManager(schedule=[0.0, 0.3, 1.0], dt_init=0.1)}
+    )
+    model.exported_times = []
+    model.results = []
+    model.prepare_simulation()
+
+    close_times = [0.3, 0.3 + 1e-12, 0.3 - 1e-12, 1.0 - 1e-12, 1.0]
+    other_times = [0.0, 0.3 + 1e-3, 0.3 - 1e-3, 0.5, 1.0 - 1e-3]
+    for t in close_times + other_times:
+        model.time_manager.time = t
+        model.save_data_time_step()
+
+    assert np.allclose(model.results, close_times)
+
+
+class DerivedQuantitiesSetup(SquareDomainOrthogonalFractures, SinglePhaseFlow):
+    """Model setup with apertures varying between cells and subdomains."""
+
+    def grid_aperture(self, sd: pp.Grid) -> np.ndarray:
+        return (sd.dim + 1) * np.arange(1, sd.num_cells + 1, dtype=float)
+
+
+def test_export_derived_quantities():
+    """Test the joint evaluation of derived quantities on all subdomains.
+
+    The exported apertures and specific volumes should equal the values evaluated for
+    each subdomain separately. The model has two intersecting fractures, thus
+    subdomains of all dimensions, and non-unit length and mass scales.
+
+    """
+    model = DerivedQuantitiesSetup(
+        {
+            "fracture_indices": [0, 1],
+            "units": pp.Units(m=2.0, kg=3.0),
+            "times_to_export": [],
+        }
+    )
+    model.prepare_simulation()
+    assert {sd.dim for sd in model.mdg.subdomains()} == {0, 1, 2}
+
+    exported = {(grid, name): values for grid, name, values in model.data_to_export()}
+    for sd in model.mdg.subdomains():
+        specific_volume = model._evaluate_and_scale(
+            sd, "specific_volume", f"m^{model.nd - sd.dim}"
+        )
+        assert np.allclose(exported[(sd, "specific_volume")], specific_volume)
+        if sd.dim < model.nd:
+            aperture = model._evaluate_and_scale(sd, "aperture", "m")
+            assert np.allclose(exported[(sd, "aperture")], aperture)
+        else:
+            assert (sd, "aperture") not in exported